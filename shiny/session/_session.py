@@ -37,7 +37,7 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import TypedDict
 
-from htmltools import TagChildArg, TagList
+from htmltools import HTMLDependency, TagChildArg, TagList
 
 if TYPE_CHECKING:
     from .._app import App
@@ -786,13 +786,16 @@ class Session(object, metaclass=SessionMeta):
     def _process_ui(self, ui: TagChildArg) -> RenderedDeps:
 
         res = TagList(ui).render()
-        deps: List[Dict[str, Any]] = []
-        for dep in res["dependencies"]:
+        return {"deps": self._process_deps(res["dependencies"]), "html": res["html"]}
+
+    def _process_deps(self, deps: List[HTMLDependency]) -> List[Dict[str, Any]]:
+        res: List[Dict[str, Any]] = []
+        for dep in deps:
             self.app._register_web_dependency(dep)
             dep_dict = dep.as_dict(lib_prefix=self.app.lib_prefix)
-            deps.append(dep_dict)
+            res.append(dep_dict)
 
-        return {"deps": deps, "html": res["html"]}
+        return res
 
     def make_scope(self, id: Id) -> "Session":
         ns = self.ns(id)
@@ -5,16 +5,23 @@ from htmltools import HTML, HTMLDependency
 from ..html_dependencies import jquery_deps
 
 
-def bootstrap_deps() -> List[HTMLDependency]:
-    dep = HTMLDependency(
+# Bootstrap is a dependency of every page and nav container, so build it once. A new
+# list is returned on each call, but the (never mutated) HTMLDependency objects are
+# shared by all callers.
+_bootstrap_deps = [
+    jquery_deps(),
+    HTMLDependency(
         name="bootstrap",
         version="5.0.1",
         source={"package": "shiny", "subdir": "www/shared/bootstrap/"},
         script={"src": "bootstrap.bundle.min.js"},
         stylesheet={"href": "bootstrap.min.css"},
-    )
-    deps = [jquery_deps(), dep]
-    return deps
+    ),
+]
+
+
+def bootstrap_deps() -> List[HTMLDependency]:
+    return list(_bootstrap_deps)
 
 
 def ionrangeslider_deps() -> List[HTMLDependency]:
@@ -20,6 +20,31 @@ from htmltools import tags, Tag, div, HTML, TagChildArg, TagAttrArg
 from .._docstring import add_example
 from ..session import Session, require_active_session
 
+# jQuery plugin doesn't work in Bootstrap 5, but vanilla JS doesn't work in Bootstrap 4 :sob:
+_MODAL_JS = HTML(
+    "\n".join(
+        [
+            "if (window.bootstrap && !window.bootstrap.Modal.VERSION.match(/^4\\. /)) {",
+            "  var modal=new bootstrap.Modal(document.getElementById('shiny-modal'))",
+            "  modal.show()",
+            "} else {",
+            "  $('#shiny-modal').modal().focus()",
+            "}",
+        ]
+    )
+)
+
+_MODAL_DIALOG_CLASS = {
+    "s": "modal-dialog modal-sm",
+    "m": "modal-dialog",
+    "l": "modal-dialog modal-lg",
+    "xl": "modal-dialog modal-xl",
+}
+
+# Passed as a positional attribute dict (rather than class_) so it merges with any
+# class_ supplied via **kwargs. htmltools copies attribute dicts, so sharing is safe
+_BTN_DEFAULT_ATTRS = {"class": "btn btn-default"}
+
 
 def modal_button(
     label: TagChildArg, icon: TagChildArg = None, **kwargs: TagChildArg
@@ -54,7 +79,7 @@ def modal_button(
     return tags.button(
         icon,
         label,
-        {"class": "btn btn-default"},
+        _BTN_DEFAULT_ATTRS,
         type="button",
         data_dismiss="modal",
         data_bs_dismiss="modal",
@@ -125,20 +150,7 @@ def modal(
             footer,
             class_="modal-content",
         ),
-        class_="modal-dialog"
-        + ({"s": " modal-sm", "l": " modal-lg", "xl": " modal-xl"}.get(size, "")),
-    )
-
-    # jQuery plugin doesn't work in Bootstrap 5, but vanilla JS doesn't work in Bootstrap 4 :sob:
-    js = "\n".join(
-        [
-            "if (window.bootstrap && !window.bootstrap.Modal.VERSION.match(/^4\\. /)) {",
-            "  var modal=new bootstrap.Modal(document.getElementById('shiny-modal'))",
-            "  modal.show()",
-            "} else {",
-            "  $('#shiny-modal').modal().focus()",
-            "}",
-        ]
+        class_=_MODAL_DIALOG_CLASS.get(size, "modal-dialog"),
     )
 
     backdrop = None if easy_close else "static"
@@ -146,7 +158,7 @@ def modal(
 
     return div(
         dialog,
-        tags.script(HTML(js)),
+        tags.script(_MODAL_JS),
         id="shiny-modal",
         class_="modal fade" if fade else "modal",
         tabindex="-1",
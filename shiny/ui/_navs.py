@@ -355,7 +355,7 @@ class NavSet:
     ) -> None:
         self.args = args
         self.ul_class = ul_class
-        self.id = id
+        self.id = resolve_id(id) if id else None
         self.selected = selected
         self.header = header
         self.footer = footer
@@ -424,7 +424,7 @@ def navset_tab(
     return NavSet(
         *args,
         ul_class="nav nav-tabs",
-        id=resolve_id(id) if id else None,
+        id=id,
         selected=selected,
         header=header,
         footer=footer,
@@ -476,7 +476,7 @@ def navset_pill(
     return NavSet(
         *args,
         ul_class="nav nav-pills",
-        id=resolve_id(id) if id else None,
+        id=id,
         selected=selected,
         header=header,
         footer=footer,
@@ -526,7 +526,7 @@ def navset_hidden(
     return NavSet(
         *args,
         ul_class="nav nav-hidden",
-        id=resolve_id(id) if id else None,
+        id=id,
         selected=selected,
         header=header,
         footer=footer,
@@ -608,7 +608,7 @@ def navset_tab_card(
     return NavSetCard(
         *args,
         ul_class="nav nav-tabs card-header-tabs",
-        id=resolve_id(id) if id else None,
+        id=id,
         selected=selected,
         header=header,
         footer=footer,
@@ -664,7 +664,7 @@ def navset_pill_card(
     return NavSetCard(
         *args,
         ul_class="nav nav-pills card-header-pills",
-        id=resolve_id(id) if id else None,
+        id=id,
         selected=selected,
         header=header,
         footer=footer,
@@ -761,7 +761,7 @@ def navset_pill_list(
     return NavSetPillList(
         *args,
         ul_class="nav nav-pills nav-stacked",
-        id=resolve_id(id) if id else None,
+        id=id,
         selected=selected,
         header=header,
         footer=footer,
@@ -929,7 +929,7 @@ def navset_bar(
     return NavSetBar(
         *args,
         ul_class="nav navbar-nav",
-        id=resolve_id(id) if id else None,
+        id=id,
         selected=selected,
         title=title,
         position=position,
@@ -65,22 +65,30 @@ def notification_show(
 
     session = require_active_session(session)
 
-    ui_ = session._process_ui(ui)
-    action_ = session._process_ui(action)
-
-    id = id if id else rand_hex(8)
+    # Tagify each part separately (their HTML is sent separately), but collect their
+    # dependencies in a single pass so they're deduplicated and registered only once
+    ui_ = TagList(ui).tagify()
+    if action is None:
+        action_html = ""
+        deps = session._process_deps(ui_.get_dependencies())
+    else:
+        action_ = TagList(action).tagify()
+        action_html = action_.get_html_string()
+        deps = session._process_deps(TagList(ui_, action_).get_dependencies())
+
+    id = id or rand_hex(8)
 
     payload: Dict[str, Any] = {
-        "html": ui_["html"],
-        "action": action_["html"],
-        "deps": ui_["deps"] + action_["deps"],
+        "html": ui_.get_html_string(),
+        "action": action_html,
+        "deps": deps,
         "closeButton": close_button,
         "id": id,
         "type": type,
     }
 
     if duration:
-        payload.update({"duration": duration * 1000})
+        payload["duration"] = duration * 1000
 
     session._send_message_sync({"notification": {"type": "show", "message": payload}})
 
@@ -28,7 +28,6 @@ from htmltools import Tagifiable  # pyright: ignore[reportUnusedImport] # noqa:
 from .._docstring import add_example
 from ._html_dependencies import bootstrap_deps
 from ._navs import navset_bar
-from .._namespaces import resolve_id
 from ..types import MISSING, MISSING_TYPE, NavSetArg
 from ._utils import get_window_title
 
@@ -115,7 +114,7 @@ def page_navbar(
             navset_bar(
                 *args,
                 title=title,
-                id=resolve_id(id) if id else None,
+                id=id,
                 selected=selected,
                 position=position,
                 header=header,
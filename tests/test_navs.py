@@ -3,12 +3,13 @@
 
 import random
 import textwrap
-from typing import Callable, Any
+from typing import Callable, Any, cast
 
 from shiny import ui
 from shiny.ui._navs import NavSet
+from shiny._namespaces import namespace_context
 from shiny._utils import private_seed
-from htmltools import TagList
+from htmltools import Tag, TagList
 
 
 # Fix the randomness of these functions to make the tests deterministic
@@ -173,3 +174,17 @@ def test_nav_markup():
           <div class="row">Page footer</div>
         </div>"""
     )
+
+
+def test_navset_id_namespace():
+    # The id is resolved once, by NavSet, against the current namespace
+    with namespace_context("mod"):
+        navset = ui.navset_tab(ui.nav("a"), id="x")
+        page = ui.page_navbar(ui.nav("a"), id="x")
+
+    assert navset.id == "mod-x"
+
+    body = cast(Tag, page.children[-1])
+    navbar = cast(NavSet, body.children[0])
+    assert isinstance(navbar, NavSet)
+    assert navbar.id == "mod-x"
@@ -1,7 +1,8 @@
 import textwrap
+from typing import Any, Dict, List, cast
 
-from shiny import ui
-from htmltools import HTMLDocument, TagList, tags
+from shiny import Session, ui
+from htmltools import HTMLDependency, HTMLDocument, Tag, TagList, tags
 
 
 def test_panel_title():
@@ -134,3 +135,51 @@ def test_modal_footer():
         }</script>
         </div>"""
     )
+
+
+class _NotificationSession:
+    """A minimal stand-in for Session that records sent messages."""
+
+    class _App:
+        lib_prefix = "lib/"
+
+        def _register_web_dependency(self, dep: HTMLDependency) -> None:
+            pass
+
+    def __init__(self) -> None:
+        self.app = self._App()
+        self.messages: List[Dict[str, Any]] = []
+
+    _process_deps = Session._process_deps
+
+    def _send_message_sync(self, message: Dict[str, Any]) -> None:
+        self.messages.append(message)
+
+
+def test_notification_show_payload():
+    dep = HTMLDependency("foo", "1.0", source={"subdir": "foo"})
+    ui_ = tags.div(dep, "Hello", tags.b("world"))
+    action = TagList(dep, tags.a("Undo", href="#"))
+
+    session = _NotificationSession()
+    ui.notification_show(ui_, action=action, session=cast(Session, session))
+    payload = session.messages[-1]["notification"]["message"]
+    assert payload["html"] == TagList(ui_).render()["html"]
+    assert payload["action"] == TagList(action).render()["html"]
+    # A dependency shared by ui and action is only sent once
+    assert [d["name"] for d in payload["deps"]] == ["foo"]
+
+    ui.notification_show(ui_, session=cast(Session, session))
+    payload = session.messages[-1]["notification"]["message"]
+    assert payload["html"] == TagList(ui_).render()["html"]
+    assert payload["action"] == ""
+    assert [d["name"] for d in payload["deps"]] == ["foo"]
+
+
+def test_modal_footer_not_shared():
+    # Modifying one modal's default footer shouldn't leak into other modals
+    x = ui.modal("hi")
+    footer = cast(Tag, x.children[0].children[0].children[-1])
+    cast(Tag, footer.children[0]).add_class("btn-danger")
+    assert "btn-danger" in str(x)
+    assert "btn-danger" not in str(ui.modal("other"))